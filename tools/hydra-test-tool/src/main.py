@@ -4,7 +4,7 @@ Minimal Hydra test tool for ExperimentStash integration testing.
 """
 
 import hydra
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 
 
 @hydra.main(version_base=None, config_path=None, config_name=None)
@@ -15,18 +15,24 @@ def main(cfg: DictConfig) -> None:
     print("🎉 SUCCESS: Hydra integration working!")
     print("=" * 60)
 
+    # OmegaConf.select returns None for absent keys instead of raising, which
+    # hasattr() on a DictConfig would catch internally on every miss
+
     # Print the message from config if it exists
-    if hasattr(cfg, 'message'):
-        print(f"📝 Message from config: {cfg.message}")
+    message = OmegaConf.select(cfg, "message")
+    if message is not None:
+        print(f"📝 Message from config: {message}")
 
     # Print the experiment name if it exists
-    if hasattr(cfg, 'experiment_name'):
-        print(f"🧪 Experiment: {cfg.experiment_name}")
+    experiment_name = OmegaConf.select(cfg, "experiment_name")
+    if experiment_name is not None:
+        print(f"🧪 Experiment: {experiment_name}")
 
     # Print any custom parameters
-    if hasattr(cfg, 'params'):
+    params = OmegaConf.select(cfg, "params")
+    if params is not None:
         print("⚙️  Parameters:")
-        for key, value in cfg.params.items():
+        for key, value in params.items():
             print(f"   {key}: {value}")
 
     print("=" * 60)
@@ -36,4 +42,4 @@ def main(cfg: DictConfig) -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()